@@ -0,0 +1,88 @@
+/**
+ * PnL Calculator Unit Tests
+ * 盈亏计算器单元测试
+ */
+
+import { PnLCalculator } from '../../l2_engine/attribution/pnl_calculator';
+import { createHoldingsBatch, resolvePrices } from '../../l2_engine/attribution/kernels';
+import { Holding, MarketData, PnLReport } from '../../types';
+
+describe('PnLCalculator', () => {
+  const holdings: Holding[] = [
+    { ticker: '0700.HK', cost: 300.0, quantity: 100 },
+    { ticker: 'BABA', cost: 80.0, quantity: 50 },
+    { ticker: 'AAPL', cost: 150.0, quantity: 20 },
+  ];
+
+  const marketMap = new Map<string, MarketData>([
+    ['0700.HK', { current_price: 345.0 }],
+    ['BABA', { current_price: 85.0 }],
+    ['AAPL', { current_price: 165.0 }],
+  ]);
+
+  const calculator = new PnLCalculator();
+
+  const run = (
+    calc: PnLCalculator,
+    items: Holding[],
+    prices: Map<string, MarketData>
+  ): PnLReport => {
+    const batch = createHoldingsBatch(items);
+    return calc.calculate(batch, resolvePrices(batch, prices));
+  };
+
+  test('should compute per-holding and total PnL', () => {
+    const report = run(calculator, holdings, marketMap);
+
+    expect(report.details.map((d) => d.pnl)).toEqual([4500, 250, 300]);
+    expect(report.details[0]).toEqual({
+      ticker: '0700.HK',
+      current_price: 345,
+      cost_price: 300,
+      quantity: 100,
+      pnl: 4500,
+      return_rate: '15.00%',
+    });
+    expect(report.total_pnl).toBe(5050);
+    expect(report.total_return_rate).toBe(`${((5050 / 37000) * 100).toFixed(2)}%`);
+    expect(report.summary).toBe('盈利');
+  });
+
+  test('should fall back to cost price when market data is missing', () => {
+    const report = run(calculator, holdings, new Map());
+
+    expect(report.total_pnl).toBe(0);
+    expect(report.details.every((d) => d.return_rate === '0.00%')).toBe(true);
+  });
+
+  test('should reuse memoized reports for the same batch and price column', () => {
+    const memoized = new PnLCalculator({ memoMinComputeMicros: 0 });
+    const batch = createHoldingsBatch(holdings);
+    const prices = resolvePrices(batch, marketMap);
+    const first = memoized.calculate(batch, prices);
+
+    expect(memoized.calculate(batch, prices)).toBe(first);
+    const repriced = new Map<string, MarketData>(marketMap).set('AAPL', { current_price: 170 });
+    const second = memoized.calculate(batch, resolvePrices(batch, repriced));
+    expect(second).not.toBe(first);
+    expect(second.total_pnl).toBe(5150);
+  });
+
+  test('should skip memoization for computations below the threshold', () => {
+    const unmemoized = new PnLCalculator({ memoMinComputeMicros: Number.POSITIVE_INFINITY });
+    const batch = createHoldingsBatch(holdings);
+    const prices = resolvePrices(batch, marketMap);
+    const first = unmemoized.calculate(batch, prices);
+
+    expect(unmemoized.calculate(batch, prices)).not.toBe(first);
+    expect(unmemoized.calculate(batch, prices)).toEqual(first);
+  });
+
+  test('should handle empty holdings', () => {
+    const report = run(calculator, [], marketMap);
+
+    expect(report.details).toEqual([]);
+    expect(report.total_pnl).toBe(0);
+    expect(report.total_return_rate).toBe('0.00%');
+  });
+});
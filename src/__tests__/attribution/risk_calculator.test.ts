@@ -0,0 +1,67 @@
+/**
+ * Risk Attribution Unit Tests
+ * 风险归因单元测试
+ *
+ * 期望值由重写前的实现（逐期累加 + 数组排序的 VaR/CVaR、逐元素的 Euler 分配）
+ * 在相同输入上计算得到，用于锁定数值行为
+ */
+
+import { RiskAttributionCalculator } from '../../l2_engine/attribution/risk_calculator';
+import { PortfolioPosition, BenchmarkData } from '../../types/attribution';
+
+// ============================================================================
+// Test Data Fixtures
+// ============================================================================
+
+const positions: PortfolioPosition[] = [
+  { ticker: '0700.HK', weight: 0.5, return: 0.15, contribution: 0.075, marketValue: 34500 },
+  { ticker: 'BABA', weight: 0.3, return: 0.0625, contribution: 0.01875, marketValue: 4250 },
+  { ticker: 'AAPL', weight: 0.2, return: 0.1, contribution: 0.02, marketValue: 3300 },
+];
+
+const returns = new Map<string, number[]>([
+  ['0700.HK', [0.012, -0.008, 0.021, -0.015, 0.004, 0.009, -0.022, 0.017, -0.003, 0.011,
+    -0.031, 0.006, 0.014, -0.009, 0.002, 0.019, -0.012, 0.007, -0.004, 0.010]],
+  ['BABA', [-0.018, 0.025, -0.011, 0.032, -0.027, 0.005, 0.014, -0.036, 0.021, -0.007,
+    0.013, -0.024, 0.009, 0.030, -0.016, -0.002, 0.018, -0.029, 0.011, 0.004]],
+  ['AAPL', [0.006, 0.003, -0.009, 0.011, 0.002, -0.014, 0.008, 0.004, -0.006, 0.013,
+    -0.010, 0.007, -0.002, 0.005, 0.009, -0.017, 0.012, 0.001, -0.005, 0.008]],
+]);
+
+const benchmark: BenchmarkData = {
+  name: 'Equal Weight',
+  weights: new Map([['0700.HK', 1 / 3], ['BABA', 1 / 3], ['AAPL', 1 / 3]]),
+  returns: new Map(),
+  totalReturn: 0,
+};
+
+// ============================================================================
+// Tests
+// ============================================================================
+
+describe('RiskAttributionCalculator', () => {
+  const result = new RiskAttributionCalculator().calculateAttribution(positions, benchmark, returns);
+
+  test('should match baseline portfolio volatility, VaR and CVaR', () => {
+    expect(result.portfolioVolatility).toBeCloseTo(0.00559909767166479, 12);
+    // 95% 置信度、20 期：VaR 取第 2 小的情景收益，CVaR 取最小两期的均值
+    expect(result.portfolioVaR).toBeCloseTo(0.0057, 12);
+    expect(result.portfolioCVaR).toBeCloseTo(0.00965, 12);
+  });
+
+  test('should match baseline Euler risk contributions', () => {
+    const expected = [
+      { ticker: '0700.HK', marginal: 0.003581780139967149, percentage: 0.3198533361985604, riskAdjusted: 0.2344824690321225 },
+      { ticker: 'BABA', marginal: 0.0019495246533398761, percentage: 0.10445565166004081, riskAdjusted: 0.17950201546799363 },
+      { ticker: 'AAPL', marginal: 0.00006779287835776566, percentage: 0.0024215644138820204, riskAdjusted: 8.259123682750984 },
+    ];
+
+    expect(result.positionContributions.map((c) => c.ticker)).toEqual(expected.map((e) => e.ticker));
+    result.positionContributions.forEach((contribution, i) => {
+      expect(contribution.weight).toBe(positions[i].weight);
+      expect(contribution.marginalContribution).toBeCloseTo(expected[i].marginal, 12);
+      expect(contribution.percentageContribution).toBeCloseTo(expected[i].percentage, 12);
+      expect(contribution.riskAdjustedReturn).toBeCloseTo(expected[i].riskAdjusted, 9);
+    });
+  });
+});
@@ -2,7 +2,7 @@
 import { Dispatcher } from '../../l1_orchestration/dispatcher';
 import { LLMService } from '../../l4_inference/llm_service';
 import { UserDB } from '../../l5_data/user_db';
-import { getStockPrice } from '../../l5_data/market_mcp';
+import { getStockPrices } from '../../l5_data/market_mcp';
 import { SearchEngine } from '../../l3_rag/search_engine';
 
 // Mock dependencies
@@ -15,7 +15,7 @@ describe('Dispatcher Tests', () => {
   let dispatcher: Dispatcher;
   let mockLLMService: jest.Mocked<LLMService>;
   let mockUserDB: jest.Mocked<UserDB>;
-  let mockGetStockPrice: jest.Mock;
+  let mockGetStockPrices: jest.Mock;
   let mockSearchEngine: jest.Mocked<SearchEngine>;
 
   beforeEach(() => {
@@ -30,19 +30,19 @@ describe('Dispatcher Tests', () => {
     // Wire up mocks
     (UserDB as jest.Mock).mockImplementation(() => mockUserDB);
     (SearchEngine as jest.Mock).mockImplementation(() => mockSearchEngine);
-    mockGetStockPrice = getStockPrice as jest.Mock;
+    mockGetStockPrices = getStockPrices as jest.Mock;
 
     dispatcher = new Dispatcher(mockLLMService);
   });
 
   test('handleRequest should orchestrate full flow successfully', async () => {
     // Mock Data
-    mockUserDB.getUserHoldings.mockReturnValue([
+    mockUserDB.getUserHoldings.mockResolvedValue([
       { ticker: 'AAPL', cost: 150, quantity: 10 }
     ]);
-    mockGetStockPrice.mockResolvedValue({
-      ticker: 'AAPL', current_price: 165, change_percent: '10%'
-    });
+    mockGetStockPrices.mockResolvedValue([
+      { ticker: 'AAPL', current_price: 165, change_percent: '10%' }
+    ]);
     mockSearchEngine.search.mockResolvedValue([]);
     mockLLMService.generate.mockResolvedValue(`
       总盈亏 150，收益率 10.00%。
@@ -53,7 +53,7 @@ describe('Dispatcher Tests', () => {
     const result = await dispatcher.handleRequest('user1', '分析我的持仓');
 
     expect(mockUserDB.getUserHoldings).toHaveBeenCalledWith('user1');
-    expect(mockGetStockPrice).toHaveBeenCalledWith('AAPL');
+    expect(mockGetStockPrices).toHaveBeenCalledWith(['AAPL']);
     expect(mockLLMService.generate).toHaveBeenCalled();
     expect(result).toContain('总盈亏 150');
   });
@@ -0,0 +1,36 @@
+import { ContentProcessor } from '../../l3_rag/processors/content_processor';
+import { SearchResultItem, SourceType } from '../../l3_rag/types';
+
+const makeItem = (id: number, reliabilityScore: number, publishTime: number): SearchResultItem => ({
+  id: `doc-${id}`,
+  title: `Title ${id}`,
+  content: `Content ${id}`,
+  source: `source-${id}`,
+  publishTime,
+  type: SourceType.NEWS,
+  reliabilityScore,
+});
+
+describe('L3 ContentProcessor', () => {
+  const processor = new ContentProcessor();
+
+  test('should cap results at 10 and match a full sort', () => {
+    const items = Array.from({ length: 25 }, (_, i) => makeItem(i, (i % 5) / 4, (i * 7) % 11));
+    const expected = [...items]
+      .sort((a, b) => b.reliabilityScore - a.reliabilityScore || b.publishTime - a.publishTime)
+      .slice(0, 10);
+
+    const results = processor.process(items);
+
+    expect(results).toHaveLength(10);
+    expect(results.map((r) => r.id)).toEqual(expected.map((r) => r.id));
+  });
+
+  test('should keep input order for equal reliability and publish time', () => {
+    const items = Array.from({ length: 12 }, (_, i) => makeItem(i, 0.8, 1000));
+
+    const results = processor.process(items);
+
+    expect(results.map((r) => r.id)).toEqual(items.slice(0, 10).map((r) => r.id));
+  });
+});
@@ -0,0 +1,22 @@
+import { QueryPlanner } from '../../l3_rag/query_planner';
+import { SourceType } from '../../l3_rag/types';
+
+describe('L3 Query Planner', () => {
+  const planner = new QueryPlanner();
+
+  test('Should detect a single ticker case-insensitively', () => {
+    expect(planner.plan('aapl 最近怎么样').detectedEntities).toEqual(['AAPL']);
+    expect(planner.plan('苹果最近怎么样').detectedEntities).toEqual(['AAPL']);
+  });
+
+  test('Should detect multiple tickers in one query without duplicates', () => {
+    const intent = planner.plan('腾讯和阿里哪个好，0700 还能买吗');
+    expect(intent.detectedEntities).toEqual(['0700.HK', 'BABA']);
+  });
+
+  test('Should leave entities empty when no ticker keyword matches', () => {
+    const intent = planner.plan('发布了什么公告');
+    expect(intent.detectedEntities).toEqual([]);
+    expect(intent.requiredSources).toEqual([SourceType.OFFICIAL]);
+  });
+});
@@ -1,14 +1,20 @@
 
 import { RAGService } from '../../l3_rag/rag_service';
 import { SourceType } from '../../l3_rag/types';
+import { cache } from '../../l6_infrastructure/cache';
 
 describe('L3 RAG Service (Information Triangle)', () => {
   let ragService: RAGService;
 
-  beforeEach(() => {
+  beforeEach(async () => {
+    await cache.flush();
     ragService = new RAGService();
   });
 
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
   test('Should route "Announcement" query to Official source', async () => {
     const query = '腾讯发布了什么公告';
     const results = await ragService.search(query);
@@ -57,4 +63,33 @@ describe('L3 RAG Service (Information Triangle)', () => {
       expect(firstScore).toBeGreaterThanOrEqual(lastScore);
     }
   });
+
+  test('Should serve repeated queries from the shared cache', async () => {
+    const query = '腾讯发布了什么公告';
+    const first = await ragService.search(query);
+
+    // 另一个实例（模拟另一个 worker）命中共享缓存
+    const other = new RAGService();
+    const planSpy = jest.spyOn((other as any).planner, 'plan');
+    const second = await other.search(query);
+
+    expect(second).toEqual(first);
+    expect(planSpy).not.toHaveBeenCalled();
+  });
+
+  test('Should not cache results when a provider fails', async () => {
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+    const query = '腾讯发布了什么公告';
+    const official = (ragService as any).providers.get(SourceType.OFFICIAL);
+    const providerSpy = jest
+      .spyOn(official, 'search')
+      .mockRejectedValueOnce(new Error('official down'));
+    const planSpy = jest.spyOn((ragService as any).planner, 'plan');
+
+    await ragService.search(query);
+    await ragService.search(query);
+
+    expect(planSpy).toHaveBeenCalledTimes(2);
+    expect(providerSpy).toHaveBeenCalledTimes(2);
+  });
 });
@@ -0,0 +1,35 @@
+import { VectorStore } from '../../l3_rag/vector_store';
+
+describe('L3 Vector Store', () => {
+  const createStore = () => {
+    const store = new VectorStore(3, 1);
+    store.addDocument({ id: 'tech', content: '科技', embedding: [1, 0, 0] });
+    store.addDocument({ id: 'finance', content: '金融', embedding: [0, 1, 0] });
+    store.addDocument({ id: 'mixed', content: '科技金融', embedding: [1, 1, 0] });
+    store.addDocument({ id: 'energy', content: '能源', embedding: [0, 0, 5] });
+    return store;
+  };
+
+  test('Should rank documents by cosine similarity', () => {
+    const results = createStore().searchSimilar([2, 0.1, 0], 2);
+
+    expect(results.map((r) => r.id)).toEqual(['tech', 'mixed']);
+    expect(results[0].score).toBeGreaterThan(results[1].score);
+  });
+
+  test('Should ignore vector magnitude', () => {
+    const [best] = createStore().searchSimilar([0, 0, 0.01], 1);
+    expect(best.id).toBe('energy');
+    expect(best.score).toBeCloseTo(1, 5);
+  });
+
+  test('Should grow beyond initial capacity and cap topK at store size', () => {
+    const store = createStore();
+    expect(store.size).toBe(4);
+    expect(store.searchSimilar([1, 1, 1], 10)).toHaveLength(4);
+  });
+
+  test('Should reject embeddings with the wrong dimension', () => {
+    expect(() => createStore().searchSimilar([1, 0], 1)).toThrow('VectorStoreError');
+  });
+});
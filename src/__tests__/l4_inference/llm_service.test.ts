@@ -0,0 +1,85 @@
+import axios from 'axios';
+import { PassThrough } from 'stream';
+import { LLMService, SSE_FRAME_INITIAL_BYTES } from '../../l4_inference/llm_service';
+
+jest.mock('axios');
+
+const sseLine = (content: string): string =>
+  `data: ${JSON.stringify({ choices: [{ delta: { content } }] })}`;
+
+describe('LLMService streaming', () => {
+  let stream: PassThrough;
+  let stdoutWrite: jest.SpyInstance;
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    jest.spyOn(console, 'log').mockImplementation(() => {});
+    stdoutWrite = jest.spyOn(process.stdout, 'write').mockImplementation(() => true);
+
+    stream = new PassThrough();
+    (axios.create as jest.Mock).mockReturnValue({
+      post: jest.fn().mockResolvedValue({ data: stream }),
+    });
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  test('should frame SSE lines split across network chunks', async () => {
+    const service = new LLMService('test-model', 'test-key');
+    const pending = service.generate('prompt');
+    await new Promise((resolve) => setImmediate(resolve));
+
+    // 1. 行在 JSON 中间断开
+    const first = `${sseLine('盈亏')}\n`;
+    const jsonSplit = first.indexOf('"delta"');
+    stream.write(Buffer.from(first.slice(0, jsonSplit)));
+    stream.write(Buffer.from(first.slice(jsonSplit)));
+
+    // 2. 行在多字节字符中间断开
+    const second = Buffer.from(`${sseLine('腾讯')}\n`);
+    const charSplit = second.indexOf(Buffer.from('腾')) + 1;
+    stream.write(second.subarray(0, charSplit));
+    stream.write(second.subarray(charSplit));
+
+    // 3. 超过初始帧缓冲区的长行，分两块到达
+    const long = 'x'.repeat(SSE_FRAME_INITIAL_BYTES + 1024);
+    const third = `${sseLine(long)}\r\n`;
+    stream.write(Buffer.from(third.slice(0, SSE_FRAME_INITIAL_BYTES - 10)));
+    stream.write(Buffer.from(third.slice(SSE_FRAME_INITIAL_BYTES - 10)));
+
+    // 4. [DONE] 与末尾没有换行的最后一行
+    stream.write(Buffer.from('data: [DONE]\n'));
+    stream.end(Buffer.from(sseLine('。')));
+
+    const expected = `盈亏腾讯${long}。`;
+    await expect(pending).resolves.toBe(expected);
+    expect(stdoutWrite.mock.calls.map(([text]) => text).join('')).toBe(expected);
+    service.close();
+  });
+
+  test('should flush buffered tokens after the interval when the stream pauses', async () => {
+    // 只模拟定时器，流事件依赖的 nextTick/setImmediate 保持真实
+    jest.useFakeTimers({ doNotFake: ['nextTick', 'setImmediate'] });
+    try {
+      const service = new LLMService('test-model', 'test-key');
+      const pending = service.generate('prompt');
+      await new Promise((resolve) => setImmediate(resolve));
+
+      stream.write(Buffer.from(`${sseLine('盈')}\n${sseLine('亏')}\n`));
+      await new Promise((resolve) => setImmediate(resolve));
+      expect(stdoutWrite).not.toHaveBeenCalled();
+
+      jest.advanceTimersByTime(16);
+      expect(stdoutWrite).toHaveBeenCalledWith('盈亏');
+
+      stream.end();
+      await expect(pending).resolves.toBe('盈亏');
+      expect(stdoutWrite).toHaveBeenCalledTimes(1);
+      service.close();
+    } finally {
+      jest.useRealTimers();
+    }
+  });
+});
@@ -0,0 +1,136 @@
+import yahooFinance from 'yahoo-finance2';
+import { performance } from 'perf_hooks';
+import {
+  PRICE_TTL_SECONDS,
+  clearPriceCache,
+  getStockPrice,
+  getStockPrices,
+} from '../../l5_data/market_mcp';
+import { cache } from '../../l6_infrastructure/cache';
+
+describe('MarketMCP Tests', () => {
+  const mockQuote = yahooFinance.quote as jest.Mock;
+
+  beforeEach(async () => {
+    jest.clearAllMocks();
+    clearPriceCache();
+    await cache.flush();
+    mockQuote.mockImplementation(async (symbols: string[]) =>
+      symbols.map((symbol) => ({
+        symbol,
+        regularMarketPrice: 165,
+        regularMarketPreviousClose: 150,
+        regularMarketVolume: 1000,
+      }))
+    );
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  test('getStockPrice should map quote fields', async () => {
+    const price = await getStockPrice('AAPL');
+    expect(price).toEqual({
+      ticker: 'AAPL',
+      current_price: 165,
+      change_percent: '10.00%',
+      volume: 1000,
+    });
+  });
+
+  test('repeated calls within TTL should hit the cache', async () => {
+    await getStockPrice('AAPL');
+    await getStockPrice('AAPL');
+    expect(mockQuote).toHaveBeenCalledTimes(1);
+  });
+
+  test('concurrent calls for the same ticker should share one request', async () => {
+    await Promise.all([getStockPrice('AAPL'), getStockPrice('AAPL'), getStockPrice('AAPL')]);
+    expect(mockQuote).toHaveBeenCalledTimes(1);
+  });
+
+  test('getStockPrices should batch cache misses into one request', async () => {
+    await getStockPrice('AAPL');
+    const prices = await getStockPrices(['AAPL', 'BABA', '0700.HK', 'BABA']);
+
+    expect(prices.map((p) => p.ticker)).toEqual(['AAPL', 'BABA', '0700.HK', 'BABA']);
+    expect(mockQuote).toHaveBeenCalledTimes(2);
+    expect(mockQuote).toHaveBeenLastCalledWith(['BABA', '0700.HK']);
+  });
+
+  test('normalized quote symbols should map back to the requested ticker', async () => {
+    mockQuote.mockImplementationOnce(async (symbols: string[]) =>
+      symbols.map((symbol) => ({
+        symbol: symbol.toUpperCase(),
+        regularMarketPrice: 165,
+        regularMarketPreviousClose: 150,
+        regularMarketVolume: 1000,
+      }))
+    );
+
+    const [hk, us] = await getStockPrices(['0700.hk', 'aapl']);
+    expect(hk).toEqual({ ticker: '0700.hk', current_price: 165, change_percent: '10.00%', volume: 1000 });
+    expect(us.ticker).toBe('aapl');
+    expect(us.current_price).toBe(165);
+
+    // 按请求的 ticker 写入缓存
+    await getStockPrice('0700.hk');
+    expect(mockQuote).toHaveBeenCalledTimes(1);
+  });
+
+  test('local cache misses should be served from the shared cache', async () => {
+    await getStockPrice('AAPL');
+    clearPriceCache();
+
+    const price = await getStockPrice('AAPL');
+    expect(price.current_price).toBe(165);
+    expect(mockQuote).toHaveBeenCalledTimes(1);
+  });
+
+  test('shared cache hits should only live locally for the remaining TTL', async () => {
+    const fetchedAt = Date.now() - (PRICE_TTL_SECONDS - 1) * 1000;
+    const shared = { ticker: 'AAPL', current_price: 170, change_percent: '1.00%', volume: 500 };
+    await cache.set('px:AAPL', { price: shared, fetchedAt }, PRICE_TTL_SECONDS);
+
+    expect(await getStockPrice('AAPL')).toEqual(shared);
+    expect(mockQuote).not.toHaveBeenCalled();
+
+    // 本地条目在剩余的 1 秒后过期，而不是再保留完整的 TTL
+    await cache.flush();
+    const now = performance.now();
+    jest.spyOn(performance, 'now').mockReturnValue(now + 2000);
+    expect((await getStockPrice('AAPL')).current_price).toBe(165);
+    expect(mockQuote).toHaveBeenCalledTimes(1);
+  });
+
+  test('expired shared entries should be refetched', async () => {
+    const fetchedAt = Date.now() - PRICE_TTL_SECONDS * 1000 - 1;
+    const shared = { ticker: 'AAPL', current_price: 170, change_percent: '1.00%', volume: 500 };
+    await cache.set('px:AAPL', { price: shared, fetchedAt }, PRICE_TTL_SECONDS);
+
+    expect((await getStockPrice('AAPL')).current_price).toBe(165);
+    expect(mockQuote).toHaveBeenCalledTimes(1);
+  });
+
+  test('shared cache failures should fall back to the upstream request', async () => {
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+    jest.spyOn(cache, 'get').mockRejectedValueOnce(new Error('redis down'));
+
+    const price = await getStockPrice('AAPL');
+    expect(price.current_price).toBe(165);
+    expect(mockQuote).toHaveBeenCalledTimes(1);
+  });
+
+  test('mock fallback on network error should not be cached', async () => {
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+    mockQuote.mockRejectedValueOnce(new Error('network down'));
+
+    const fallback = await getStockPrice('AAPL');
+    expect(fallback.note).toBeDefined();
+
+    const price = await getStockPrice('AAPL');
+    expect(price.current_price).toBe(165);
+    expect(mockQuote).toHaveBeenCalledTimes(2);
+  });
+});
@@ -0,0 +1,39 @@
+import { RedisCacheService, cache } from '../../l6_infrastructure/cache';
+
+describe('RedisCacheService (Mock Mode)', () => {
+  const maxEntries = (RedisCacheService as any).MAX_ENTRIES as number;
+
+  beforeEach(async () => {
+    await cache.flush();
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  test('should evict the oldest keys once the entry limit is reached', async () => {
+    for (let i = 0; i <= maxEntries; i++) {
+      await cache.set(`rag:query-${i}`, i, 300);
+    }
+
+    expect(await cache.get('rag:query-0')).toBeNull();
+    expect(await cache.get(`rag:query-${maxEntries}`)).toBe(maxEntries);
+    expect((cache as any).storage.size).toBeLessThanOrEqual(maxEntries);
+  });
+
+  test('should sweep expired keys before evicting live ones', async () => {
+    const now = Date.now();
+    const clock = jest.spyOn(Date, 'now').mockReturnValue(now);
+    await cache.set('rag:live', 'live', 3600);
+    for (let i = 1; i < maxEntries; i++) {
+      await cache.set(`rag:query-${i}`, i, 1);
+    }
+
+    clock.mockReturnValue(now + 2000);
+    await cache.set('rag:new', 'new', 300);
+
+    expect((cache as any).storage.size).toBe(2);
+    expect(await cache.get('rag:live')).toBe('live');
+    expect(await cache.get('rag:new')).toBe('new');
+  });
+});
@@ -0,0 +1,31 @@
+import { KeywordAutomaton } from '../../l6_infrastructure/keyword_automaton';
+
+describe('KeywordAutomaton Tests', () => {
+  test('should find all keywords in a single scan, including overlaps', () => {
+    const automaton = new KeywordAutomaton<string>([
+      ['he', 'he'],
+      ['she', 'she'],
+      ['his', 'his'],
+      ['hers', 'hers'],
+    ]);
+
+    expect(automaton.matchAll('ushers')).toEqual(new Set(['she', 'he', 'hers']));
+    expect(automaton.matchAll('hxhis')).toEqual(new Set(['his']));
+  });
+
+  test('should return mapped values for CJK keywords', () => {
+    const automaton = new KeywordAutomaton<string>([
+      ['腾讯', '0700.HK'],
+      ['0700', '0700.HK'],
+      ['苹果', 'AAPL'],
+    ]);
+
+    expect(automaton.matchAll('腾讯和苹果的走势')).toEqual(new Set(['0700.HK', 'AAPL']));
+    expect(automaton.matchAll('阿里巴巴')).toEqual(new Set());
+  });
+
+  test('should ignore empty keywords', () => {
+    const automaton = new KeywordAutomaton<string>([['', 'empty']]);
+    expect(automaton.matchAll('anything').size).toBe(0);
+  });
+});
@@ -3,14 +3,17 @@ import { Guardrails } from './guardrails';
 import { PromptFactory } from './prompt_factory';
 import { 
   BrinsonAttributionCalculator, 
-  RiskAttributionCalculator 
+  PnLCalculator,
+  RiskAttributionCalculator,
+  createHoldingsBatch,
+  resolvePrices
 } from '../l2_engine/attribution';
 import { SearchEngine } from '../l3_rag/search_engine';
-import { getStockPrice } from '../l5_data/market_mcp';
+import { getStockPrices } from '../l5_data/market_mcp';
 import { UserDB } from '../l5_data/user_db';
 import { NewsData } from '../l5_data/news_data';
 import {
-  Holding,
+  HoldingsBatch,
   MarketData,
   PnLReport,
   RiskReport,
@@ -34,6 +37,7 @@ export class Dispatcher {
   private newsData: NewsData;
   private searchEngine: SearchEngine;
   private brinsonCalc: BrinsonAttributionCalculator;
+  private pnlCalc: PnLCalculator;
   private riskCalc: RiskAttributionCalculator;
 
   constructor(llmService: LLMService) {
@@ -42,6 +46,7 @@ export class Dispatcher {
     this.newsData = new NewsData();
     this.searchEngine = new SearchEngine(this.newsData);
     this.brinsonCalc = new BrinsonAttributionCalculator();
+    this.pnlCalc = new PnLCalculator();
     this.riskCalc = new RiskAttributionCalculator();
   }
 
@@ -64,12 +69,17 @@ export class Dispatcher {
     console.log('[L1] Dispatching tasks to L2, L3, L5...');
 
     // 2.1 Get User Holdings
-    const holdings = this.userDB.getUserHoldings(userId);
+    const holdings = await this.userDB.getUserHoldings(userId);
+    // Columnar view of holdings, built once and shared by L5 and L2
+    const batch = createHoldingsBatch(holdings);
 
-    // 2.2 Get Real-time Market Data (L5 -> MarketMCP)
-    const marketResults: StockPrice[] = await Promise.all(
-      holdings.map((item) => getStockPrice(item.ticker))
-    );
+    // 2.2 Get Real-time Market Data (L5 -> MarketMCP, single batched request)
+    //     and Retrieve News/Context (L3) concurrently — neither depends on the other
+    const topHolding = holdings[0]?.ticker ?? '';
+    const [marketResults, ragData]: [StockPrice[], SearchResult[]] = await Promise.all([
+      getStockPrices(batch.tickers),
+      this.searchEngine.search(`${topHolding} ${query}`),
+    ]);
 
     // Map market results to ticker for easy lookup
     const currentMap = new Map<string, MarketData>();
@@ -79,10 +89,11 @@ export class Dispatcher {
       }
     }
 
-    // Prepare data for L2 Engines
-    const positions = this.calculatePortfolioPositions(holdings, currentMap);
-    const benchmark = this.createDummyBenchmark(holdings.map(h => h.ticker));
-    const mockReturns = this.getMockHistoricalReturns(holdings.map(h => h.ticker));
+    // Prepare data for L2 Engines (price column aligned with the holdings batch)
+    const prices = resolvePrices(batch, currentMap);
+    const positions = this.calculatePortfolioPositions(batch, prices);
+    const benchmark = this.createDummyBenchmark(batch.tickers);
+    const mockReturns = this.getMockHistoricalReturns(batch.tickers);
 
     // 2.3 Calculate PnL (L2 - Brinson Engine)
     let brinsonResult;
@@ -98,40 +109,13 @@ export class Dispatcher {
       return `系统内部错误: 归因计算失败 (${error instanceof Error ? error.message : 'Unknown'})`;
     }
     
-    // Map Brinson result to PnLReport
+    // Absolute PnL from holdings (L2 - PnL Engine), return rate from Brinson
     const pnlData: PnLReport = {
-      total_pnl: positions.reduce((sum, p) => sum + (p.marketValue - (p.marketValue / (1 + p.return))), 0), // Approx cost based calculation
+      ...this.pnlCalc.calculate(batch, prices),
       total_return_rate: `${(brinsonResult.portfolioReturn * 100).toFixed(2)}%`,
-      details: positions.map(p => ({
-        ticker: p.ticker,
-        current_price: p.marketValue / p.weight * (1/positions.reduce((s,pos)=>s+pos.marketValue,0)) || 0, // Simplify: just use market data if needed
-        cost_price: 0, // Not carried in PortfolioPosition, simpler to use original holdings
-        quantity: 0,
-        pnl: p.marketValue - (p.marketValue / (1 + p.return)),
-        return_rate: `${(p.return * 100).toFixed(2)}%`
-      })),
       summary: brinsonResult.portfolioReturn >= 0 ? '盈利' : '亏损'
     };
 
-    // Refine details using original holdings
-    pnlData.details = holdings.map(h => {
-      const market = currentMap.get(h.ticker);
-      const currentPrice = market?.current_price || h.cost; // Fallback
-      const pnl = (currentPrice - h.cost) * h.quantity;
-      const returnRate = (currentPrice - h.cost) / h.cost;
-      return {
-        ticker: h.ticker,
-        current_price: currentPrice,
-        cost_price: h.cost,
-        quantity: h.quantity,
-        pnl: pnl,
-        return_rate: `${(returnRate * 100).toFixed(2)}%`
-      };
-    });
-    // Recalculate total PnL from refined details to be exact
-    pnlData.total_pnl = pnlData.details.reduce((sum, d) => sum + d.pnl, 0);
-
-
     // 2.4 Calculate Risk (L2 - Risk Engine)
     let riskResult;
     try {
@@ -159,13 +143,6 @@ export class Dispatcher {
       }))
     };
 
-    // 2.5 Retrieve News/Context (L3)
-    // Search for context relevant to holdings
-    const topHolding = holdings[0]?.ticker ?? '';
-    const ragData: SearchResult[] = await this.searchEngine.search(
-      `${topHolding} ${query}`
-    );
-
     // 3. Prompt Assembly (L1)
     const prompt = PromptFactory.getFinReportPrompt(pnlData, ragData, riskData);
 
@@ -211,42 +188,34 @@ export class Dispatcher {
   // ==========================================================================
 
   private calculatePortfolioPositions(
-    holdings: Holding[],
-    marketMap: Map<string, MarketData>
+    batch: HoldingsBatch,
+    prices: Float64Array
   ): PortfolioPosition[] {
-    const positions: PortfolioPosition[] = [];
-    let totalCostValue = 0;
+    const { tickers, cost, quantity } = batch;
+    const n = tickers.length;
 
-    // 1. Calculate Market Values and Returns
-    for (const holding of holdings) {
-      const market = marketMap.get(holding.ticker);
-      const currentPrice = market?.current_price || holding.cost; // Fallback to cost if no price
-      const marketValue = currentPrice * holding.quantity;
-      const costValue = holding.cost * holding.quantity;
-      const return_ = (currentPrice - holding.cost) / holding.cost;
-      
-      totalCostValue += costValue;
-      
-      positions.push({
-        ticker: holding.ticker,
-        weight: 0, // Will update
-        return: return_,
-        contribution: 0, // Will update
-        marketValue: marketValue,
-        portfolioWeight: 0 // Compat
-      });
+    // 1. Total cost value
+    // Use COST basis for weights so that portfolio return matches (TotalMV - TotalCost)/TotalCost
+    let totalCostValue = 0;
+    for (let i = 0; i < n; i++) {
+      totalCostValue += cost[i] * quantity[i];
     }
 
-    // 2. Calculate Weights and Contributions
-    // Use COST basis for weights so that portfolio return matches (TotalMV - TotalCost)/TotalCost
-    for (let i = 0; i < positions.length; i++) {
-      const pos = positions[i];
-      const holding = holdings[i];
-      const costValue = holding.cost * holding.quantity;
+    // 2. Calculate Market Values, Returns, Weights and Contributions
+    const positions: PortfolioPosition[] = new Array(n);
+    for (let i = 0; i < n; i++) {
+      const costValue = cost[i] * quantity[i];
+      const return_ = (prices[i] - cost[i]) / cost[i];
+      const weight = totalCostValue > 0 ? costValue / totalCostValue : 0;
 
-      pos.weight = totalCostValue > 0 ? costValue / totalCostValue : 0;
-      pos.portfolioWeight = pos.weight;
-      pos.contribution = pos.weight * pos.return;
+      positions[i] = {
+        ticker: tickers[i],
+        weight,
+        return: return_,
+        contribution: weight * return_,
+        marketValue: prices[i] * quantity[i],
+        portfolioWeight: weight // Compat
+      };
     }
 
     return positions;
@@ -1,3 +1,4 @@
+import _ from 'lodash';
 import { PnLDetail, ConsistencyCheckResult } from '../types';
 
 /**
@@ -7,19 +8,28 @@ import { PnLDetail, ConsistencyCheckResult } from '../types';
 export class Guardrails {
   private static readonly FORBIDDEN_KEYWORDS = ['内幕', '诈骗', '非法'];
 
+  // 敏感词合并为单个正则，一次扫描即可完成匹配
+  private static readonly FORBIDDEN_PATTERN = new RegExp(
+    Guardrails.FORBIDDEN_KEYWORDS.map((keyword) => _.escapeRegExp(keyword)).join('|')
+  );
+
+  private static readonly RISK_DISCLAIMER = '风险提示';
+
+  // Numbers: optional sign, digits with commas, optional decimal, optional percent
+  private static readonly NUMBER_PATTERN = /[-+]?[\d,]+(\.\d+)?%?/g;
+
   /**
    * 输入安全拦截
    * @param userQuery 用户查询
    * @returns 验证结果和消息
    */
   static validateInput(userQuery: string): { isSafe: boolean; message: string } {
-    for (const keyword of Guardrails.FORBIDDEN_KEYWORDS) {
-      if (userQuery.includes(keyword)) {
-        return {
-          isSafe: false,
-          message: `检测到敏感词: ${keyword}`,
-        };
-      }
+    const match = Guardrails.FORBIDDEN_PATTERN.exec(userQuery);
+    if (match) {
+      return {
+        isSafe: false,
+        message: `检测到敏感词: ${match[0]}`,
+      };
     }
     return { isSafe: true, message: '' };
   }
@@ -61,31 +71,13 @@ export class Guardrails {
   ): ConsistencyCheckResult {
     const issues: string[] = [];
 
-    // Helper: Extract numbers from text and check if any matches expected value with tolerance
-    const containsNumber = (text: string, expected: number, tolerance = 0.05): boolean => {
-      // Regex to find numbers: optional sign, digits, optional decimal, optional percent
-      const regex = /[-+]?[\d,]+(\.\d+)?%?/g; 
-      const matches = text.match(regex);
-      if (!matches) return false;
-
-      for (const match of matches) {
-        // Remove commas and % for parsing
-        const cleanVal = parseFloat(match.replace(/,/g, '').replace('%', ''));
-        if (isNaN(cleanVal)) continue;
-
-        // If expected is percentage (e.g. 0.15 for 15%), handle scaling
-        // If string had %, cleanVal is 15. Check against expected * 100 or expected
-        // Here expectedPnl is raw number. expectedReturn is string like "15.00%".
-        
-        if (Math.abs(cleanVal - expected) < Math.abs(expected * tolerance) + 0.01) {
-          return true;
-        }
-      }
-      return false;
-    };
+    // 回复中的数值只提取一次，供总盈亏和收益率检查共用
+    const numbers = Guardrails.extractNumbers(responseText);
+    const containsNumber = (expected: number, tolerance = 0.05): boolean =>
+      numbers.some((value) => Math.abs(value - expected) < Math.abs(expected * tolerance) + 0.01);
 
     // 1. 检查总盈亏数值
-    if (!containsNumber(responseText, expectedPnl)) {
+    if (!containsNumber(expectedPnl)) {
       // Fallback to simple string check just in case formatting is very specific
       if (!responseText.includes(String(expectedPnl))) {
         issues.push(`❌ 缺少或错误的总盈亏数值 ${expectedPnl}`);
@@ -99,7 +91,7 @@ export class Guardrails {
     // 2. 检查总收益率
     // expectedReturn is string like "12.34%". Parse it.
     const expectedReturnVal = parseFloat(expectedReturn.replace('%', ''));
-    if (!containsNumber(responseText, expectedReturnVal)) {
+    if (!containsNumber(expectedReturnVal)) {
         if (!responseText.includes(expectedReturn)) {
             issues.push(`❌ 缺少或错误的收益率 ${expectedReturn}`);
         } else {
@@ -110,14 +102,9 @@ export class Guardrails {
     }
 
     // 3. 检查个股盈亏（至少应提及主要持仓）
-    let mentionedCount = 0;
-    for (const item of pnlDetails.slice(0, 3)) {
-      // 检查前3个主要持仓
-      const ticker = item.ticker;
-      if (responseText.includes(ticker)) {
-        mentionedCount++;
-      }
-    }
+    // 检查前3个主要持仓
+    const topTickers = pnlDetails.slice(0, 3).map((item) => item.ticker);
+    const mentionedCount = topTickers.filter((ticker) => responseText.includes(ticker)).length;
 
     if (mentionedCount === 0) {
       issues.push('❌ 未提及任何具体持仓的盈亏情况');
@@ -126,7 +113,7 @@ export class Guardrails {
     }
 
     // 4. 检查风险提示
-    if (!responseText.includes('风险提示')) {
+    if (!responseText.includes(Guardrails.RISK_DISCLAIMER)) {
       issues.push('❌ 缺少风险提示');
     } else {
       issues.push('✅ 包含风险提示');
@@ -136,4 +123,21 @@ export class Guardrails {
 
     return { isConsistent, issues };
   }
+
+  /**
+   * 提取文本中的全部数值（去除千分位逗号和百分号）
+   */
+  private static extractNumbers(text: string): number[] {
+    const matches = text.match(Guardrails.NUMBER_PATTERN);
+    if (!matches) return [];
+
+    const numbers: number[] = [];
+    for (const match of matches) {
+      const cleanVal = parseFloat(match.replace(/,/g, '').replace('%', ''));
+      if (!isNaN(cleanVal)) {
+        numbers.push(cleanVal);
+      }
+    }
+    return numbers;
+  }
 }
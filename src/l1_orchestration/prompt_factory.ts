@@ -1,33 +1,15 @@
 import { PnLReport, RiskReport, SearchResult } from '../types';
 
 /**
- * L1 Orchestration - Prompt Factory
- * 提示词工厂，组装金融报告提示词
+ * 金融报告提示词模板（{{name}} 为变量占位符）
  */
-export class PromptFactory {
-  /**
-   * 生成金融报告提示词
-   * @param pnlData 盈亏数据
-   * @param newsData 新闻数据
-   * @param riskData 风险数据
-   * @returns 组装好的提示词
-   */
-  static getFinReportPrompt(
-    pnlData: PnLReport,
-    newsData: SearchResult[],
-    riskData: RiskReport
-  ): string {
-    // 提取精确数值用于验证
-    const totalPnl = pnlData.total_pnl ?? 0;
-    const totalReturn = pnlData.total_return_rate ?? '0%';
-
-    return `
+const FIN_REPORT_TEMPLATE = `
 # 角色
 你是一位专业的雪球投资分析师，擅长结合定量数据和市场情绪进行点评。
 
 # 核心约束（CRITICAL - 必须遵守）
 1. **严禁幻觉**：所有数值必须严格基于下面提供的 L2 计算数据
-2. **必须引用**：报告中必须明确引用总盈亏 ${totalPnl} 和收益率 ${totalReturn}
+2. **必须引用**：报告中必须明确引用总盈亏 {{totalPnl}} 和收益率 {{totalReturn}}
 3. **验证机制**：回复前请自检：所有金额、百分比是否与下方数据一致
 4. **禁止编造**：不得添加任何未在下方数据中出现的数值
 
@@ -35,25 +17,25 @@ export class PromptFactory {
 
 ## 1. 账户盈亏数据（L2 Quantitative - 真实数据源）
 \`\`\`json
-${JSON.stringify(pnlData, null, 2)}
+{{pnlJson}}
 \`\`\`
 
 ## 2. 持仓风险数据（L2 Risk Model）
 \`\`\`json
-${JSON.stringify(riskData, null, 2)}
+{{riskJson}}
 \`\`\`
 
 ## 3. 市场资讯（L3 RAG）
 \`\`\`json
-${JSON.stringify(newsData, null, 2)}
+{{newsJson}}
 \`\`\`
 
 # 任务要求
 请按照以下结构生成报告：
 
 1. **盈亏综述**
-   - 明确说明总盈亏金额：${totalPnl}
-   - 明确说明总收益率：${totalReturn}
+   - 明确说明总盈亏金额：{{totalPnl}}
+   - 明确说明总收益率：{{totalReturn}}
    - 总结整体表现（盈利/亏损）
    
 2. **归因分析**
@@ -63,7 +45,7 @@ ${JSON.stringify(newsData, null, 2)}
    
 3. **风险提示**
    - 基于 L2 风险模型数据指出风险点
-   - 说明风险等级：${riskData.risk_level}
+   - 说明风险等级：{{riskLevel}}
    
 4. **操作建议**
    - 基于上述定量分析给出建议
@@ -75,10 +57,50 @@ ${JSON.stringify(newsData, null, 2)}
 - 必须包含风险提示免责声明
 
 # 自检清单（回复前请逐一确认）
-- [ ] 总盈亏金额是否为 ${totalPnl}？
-- [ ] 总收益率是否为 ${totalReturn}？
+- [ ] 总盈亏金额是否为 {{totalPnl}}？
+- [ ] 总收益率是否为 {{totalReturn}}？
 - [ ] 所有个股盈亏是否与 L2 数据一致？
 - [ ] 是否未编造任何未提供的数值？
 `;
+
+// 模块加载时拆分为 [静态片段, 变量名, 静态片段, ...]，渲染时只填充变量并拼接
+const TEMPLATE_PARTS = FIN_REPORT_TEMPLATE.split(/\{\{(\w+)\}\}/);
+
+/**
+ * L1 Orchestration - Prompt Factory
+ * 提示词工厂，组装金融报告提示词
+ */
+export class PromptFactory {
+  /**
+   * 生成金融报告提示词
+   * @param pnlData 盈亏数据
+   * @param newsData 新闻数据
+   * @param riskData 风险数据
+   * @returns 组装好的提示词
+   */
+  static getFinReportPrompt(
+    pnlData: PnLReport,
+    newsData: SearchResult[],
+    riskData: RiskReport
+  ): string {
+    // 提取精确数值用于验证
+    const totalPnl = pnlData.total_pnl ?? 0;
+    const totalReturn = pnlData.total_return_rate ?? '0%';
+
+    // 数据块使用紧凑 JSON，减少提示词 token 数
+    const variables: Record<string, string> = {
+      totalPnl: String(totalPnl),
+      totalReturn,
+      riskLevel: riskData.risk_level,
+      pnlJson: JSON.stringify(pnlData),
+      riskJson: JSON.stringify(riskData),
+      newsJson: JSON.stringify(newsData),
+    };
+
+    const parts = TEMPLATE_PARTS.slice();
+    for (let i = 1; i < parts.length; i += 2) {
+      parts[i] = variables[parts[i]];
+    }
+    return parts.join('');
   }
 }
@@ -44,6 +44,21 @@ export {
   BrinsonAttributionCalculator,
 } from './brinson_calculator';
 
+// ============================================================================
+// PnL Calculation
+// ============================================================================
+
+export {
+  PnLCalculator,
+  PnLCalculatorConfig,
+  DEFAULT_PNL_CONFIG,
+} from './pnl_calculator';
+
+export {
+  createHoldingsBatch,
+  resolvePrices,
+} from './kernels';
+
 // ============================================================================
 // Risk Attribution
 // ============================================================================
@@ -0,0 +1,111 @@
+/**
+ * Numeric Kernels
+ * 数值计算内核 - 持仓列式数据构建，以及 PnL 与风险计算共用的紧凑循环
+ *
+ * 计算内核只接收 Float64Array / number[][] 并写入调用方分配的输出数组，
+ * 保持单态调用，V8 优化编译后不会因参数类型变化而去优化。
+ */
+
+import { Holding, HoldingsBatch, MarketData } from '../../types';
+
+// ============================================================================
+// Holdings Columns
+// ============================================================================
+
+/**
+ * 将持仓列表转换为列式数据
+ *
+ * @param holdings 用户持仓
+ * @returns 持仓列式数据
+ */
+export function createHoldingsBatch(holdings: Holding[]): HoldingsBatch {
+  const n = holdings.length;
+  const tickers: string[] = new Array(n);
+  const cost = new Float64Array(n);
+  const quantity = new Float64Array(n);
+  for (let i = 0; i < n; i++) {
+    tickers[i] = holdings[i].ticker;
+    cost[i] = holdings[i].cost;
+    quantity[i] = holdings[i].quantity;
+  }
+  return { tickers, cost, quantity };
+}
+
+/**
+ * 按持仓顺序解析现价列，缺少行情时以成本价计
+ *
+ * @param batch 持仓列式数据
+ * @param marketMap 行情数据 (ticker → MarketData)
+ * @returns 现价列
+ */
+export function resolvePrices(
+  batch: HoldingsBatch,
+  marketMap: Map<string, MarketData>
+): Float64Array {
+  const price = new Float64Array(batch.tickers.length);
+  for (let i = 0; i < price.length; i++) {
+    price[i] = marketMap.get(batch.tickers[i])?.current_price || batch.cost[i];
+  }
+  return price;
+}
+
+// ============================================================================
+// PnL Kernel
+// ============================================================================
+
+/**
+ * 列式计算盈亏与收益率
+ *
+ * @param cost 成本价
+ * @param quantity 持仓数量
+ * @param price 现价
+ * @param pnl 输出：各持仓盈亏
+ * @param returnRate 输出：各持仓收益率
+ * @returns 总盈亏与总成本
+ */
+export function computePnLColumns(
+  cost: Float64Array,
+  quantity: Float64Array,
+  price: Float64Array,
+  pnl: Float64Array,
+  returnRate: Float64Array
+): { totalPnl: number; totalCost: number } {
+  let totalPnl = 0;
+  let totalCost = 0;
+  for (let i = 0; i < cost.length; i++) {
+    const diff = price[i] - cost[i];
+    pnl[i] = diff * quantity[i];
+    returnRate[i] = diff / cost[i];
+    totalPnl += pnl[i];
+    totalCost += cost[i] * quantity[i];
+  }
+  return { totalPnl, totalCost };
+}
+
+// ============================================================================
+// Risk Kernel
+// ============================================================================
+
+/**
+ * 计算协方差矩阵与权重向量的乘积 Σw
+ *
+ * @param covariance 协方差矩阵（行数组）
+ * @param weights 权重向量
+ * @returns Σw
+ */
+export function multiplyCovarianceByWeights(
+  covariance: number[][],
+  weights: Float64Array
+): Float64Array {
+  const n = weights.length;
+  const result = new Float64Array(n);
+  for (let i = 0; i < n; i++) {
+    const covRow = covariance[i];
+    let sum = 0;
+    for (let j = 0; j < n; j++) {
+      sum += covRow[j] * weights[j];
+    }
+    result[i] = sum;
+  }
+  return result;
+}
@@ -0,0 +1,114 @@
+/**
+ * PnL Calculator
+ * 盈亏计算器 - 计算持仓的绝对盈亏与收益率
+ *
+ * 计算方式：
+ * 1. 输入为持仓列式数据（成本、数量）与现价列
+ * 2. 在 Float64Array 上批量计算盈亏、收益率与汇总值
+ * 3. 仅在输出边界组装 PnLDetail 对象
+ * 4. 对耗时较长的输入做结果缓存（同一持仓批次与现价列直接返回）
+ */
+
+import { HoldingsBatch, PnLDetail, PnLReport } from '../../types';
+import { computePnLColumns } from './kernels';
+
+// ============================================================================
+// PnL Calculator
+// ============================================================================
+
+/**
+ * 盈亏计算器配置
+ */
+export interface PnLCalculatorConfig {
+  memoMinComputeMicros: number; // 计算耗时低于该值的结果不缓存
+}
+
+/**
+ * 默认盈亏计算器配置
+ */
+export const DEFAULT_PNL_CONFIG: PnLCalculatorConfig = {
+  memoMinComputeMicros: 100,
+};
+
+/**
+ * 盈亏计算器
+ */
+export class PnLCalculator {
+  private config: PnLCalculatorConfig;
+  // 以输入对象本身为键（O(1)），批次或现价列被回收时缓存条目随之释放
+  private memo: WeakMap<HoldingsBatch, WeakMap<Float64Array, PnLReport>> = new WeakMap();
+
+  constructor(config: Partial<PnLCalculatorConfig> = {}) {
+    this.config = { ...DEFAULT_PNL_CONFIG, ...config };
+  }
+
+  /**
+   * 计算组合盈亏
+   * 命中缓存时返回同一个报告对象，调用方应视其为只读；
+   * 缓存按对象身份匹配，传入后的 batch 与 price 不应再原地修改
+   *
+   * @param batch 持仓列式数据
+   * @param price 现价列（与 batch 顺序一致，见 resolvePrices）
+   * @returns 盈亏分析报告
+   */
+  calculate(batch: HoldingsBatch, price: Float64Array): PnLReport {
+    const cached = this.memo.get(batch)?.get(price);
+    if (cached) {
+      return cached;
+    }
+
+    const start = process.hrtime.bigint();
+    const report = this.compute(batch, price);
+    const elapsedMicros = Number(process.hrtime.bigint() - start) / 1000;
+
+    if (elapsedMicros >= this.config.memoMinComputeMicros) {
+      let byPrice = this.memo.get(batch);
+      if (!byPrice) {
+        byPrice = new WeakMap();
+        this.memo.set(batch, byPrice);
+      }
+      byPrice.set(price, report);
+    }
+
+    return report;
+  }
+
+  // ==========================================================================
+  // 私有辅助方法
+  // ==========================================================================
+
+  /**
+   * 列式计算盈亏报告
+   */
+  private compute(batch: HoldingsBatch, price: Float64Array): PnLReport {
+    const { tickers, cost, quantity } = batch;
+    const n = tickers.length;
+
+    // 1 & 2. 批量计算盈亏与收益率
+    const pnl = new Float64Array(n);
+    const returnRate = new Float64Array(n);
+    const { totalPnl, totalCost } = computePnLColumns(cost, quantity, price, pnl, returnRate);
+
+    // 3. 组装输出
+    const details: PnLDetail[] = new Array(n);
+    for (let i = 0; i < n; i++) {
+      details[i] = {
+        ticker: tickers[i],
+        current_price: price[i],
+        cost_price: cost[i],
+        quantity: quantity[i],
+        pnl: pnl[i],
+        return_rate: `${(returnRate[i] * 100).toFixed(2)}%`,
+      };
+    }
+
+    const totalReturn = totalCost > 0 ? totalPnl / totalCost : 0;
+
+    return {
+      total_pnl: totalPnl,
+      total_return_rate: `${(totalReturn * 100).toFixed(2)}%`,
+      details,
+      summary: totalPnl >= 0 ? '盈利' : '亏损',
+    };
+  }
+}
@@ -27,6 +27,7 @@ import {
   calculateCovariance,
   calculateCorrelation,
 } from './base_attribution';
+import { multiplyCovarianceByWeights } from './kernels';
 
 // ============================================================================
 // Risk Attribution Calculator
@@ -89,14 +90,16 @@ export class RiskAttributionCalculator {
       weights,
       covarianceMatrix
     );
-    const portfolioVaR = this.calculateVaR(
+    const sortedPortfolioReturns = this.calculateSortedPortfolioReturns(
       positions,
-      returns,
+      returns
+    );
+    const portfolioVaR = this.calculateVaR(
+      sortedPortfolioReturns,
       this.config.confidenceLevel
     );
     const portfolioCVaR = this.calculateCVaR(
-      positions,
-      returns,
+      sortedPortfolioReturns,
       this.config.confidenceLevel
     );
 
@@ -167,59 +170,47 @@ export class RiskAttributionCalculator {
   }
 
   /**
-   * 计算VaR
+   * 计算组合历史情景收益序列（升序），供 VaR/CVaR 共用
    */
-  private calculateVaR(
+  private calculateSortedPortfolioReturns(
     positions: PortfolioPosition[],
-    returns: Map<string, number[]>,
-    confidenceLevel: number
-  ): number {
-    // 使用历史模拟法
-    const portfolioReturns: number[] = [];
+    returns: Map<string, number[]>
+  ): Float64Array {
     const n = returns.get(positions[0]?.ticker)?.length || 0;
+    const portfolioReturns = new Float64Array(n);
 
-    for (let t = 0; t < n; t++) {
-      let portfolioReturn = 0;
-      for (const pos of positions) {
-        const returnsArray = returns.get(pos.ticker) || [];
-        if (t < returnsArray.length) {
-          portfolioReturn += pos.weight * returnsArray[t];
-        }
+    for (const pos of positions) {
+      const returnsArray = returns.get(pos.ticker) || [];
+      const length = Math.min(n, returnsArray.length);
+      for (let t = 0; t < length; t++) {
+        portfolioReturns[t] += pos.weight * returnsArray[t];
       }
-      portfolioReturns.push(portfolioReturn);
     }
 
-    portfolioReturns.sort((a, b) => a - b);
-    const varIndex = Math.floor((1 - confidenceLevel) * portfolioReturns.length);
-    return -portfolioReturns[varIndex];
+    return portfolioReturns.sort();
+  }
+
+  /**
+   * 计算VaR（历史模拟法）
+   */
+  private calculateVaR(
+    sortedReturns: Float64Array,
+    confidenceLevel: number
+  ): number {
+    const varIndex = Math.floor((1 - confidenceLevel) * sortedReturns.length);
+    return -sortedReturns[varIndex];
   }
 
   /**
    * 计算CVaR
    */
   private calculateCVaR(
-    positions: PortfolioPosition[],
-    returns: Map<string, number[]>,
+    sortedReturns: Float64Array,
     confidenceLevel: number
   ): number {
     // 计算VaR以下的平均值
-    const portfolioReturns: number[] = [];
-    const n = returns.get(positions[0]?.ticker)?.length || 0;
-
-    for (let t = 0; t < n; t++) {
-      let portfolioReturn = 0;
-      for (const pos of positions) {
-        const returnsArray = returns.get(pos.ticker) || [];
-        if (t < returnsArray.length) {
-          portfolioReturn += pos.weight * returnsArray[t];
-        }
-      }
-      portfolioReturns.push(portfolioReturn);
-    }
-
-    portfolioReturns.sort((a, b) => a - b);
-    const varIndex = Math.floor((1 - confidenceLevel) * portfolioReturns.length);
-    const cvarReturns = portfolioReturns.slice(0, varIndex + 1);
+    const varIndex = Math.floor((1 - confidenceLevel) * sortedReturns.length);
+    const cvarReturns = sortedReturns.subarray(0, varIndex + 1);
     return -cvarReturns.reduce((a, b) => a + b, 0) / cvarReturns.length;
   }
 
@@ -279,15 +270,15 @@ export class RiskAttributionCalculator {
     const contributions: PositionRiskContribution[] = [];
     const n = positions.length;
 
+    // 一次性计算 Σw，循环内只做标量运算
+    const weights = Float64Array.from(positions, (p) => p.weight);
+    const covTimesWeights = multiplyCovarianceByWeights(covarianceMatrix.to2DArray(), weights);
+
     for (let i = 0; i < n; i++) {
       const pos = positions[i];
 
-      // 计算边际风险贡献
-      let marginalContribution = 0;
-      for (let j = 0; j < n; j++) {
-        marginalContribution +=
-          pos.weight * covarianceMatrix.get(i, j) * positions[j].weight;
-      }
+      // 计算边际风险贡献: w_i * (Σw)_i / σ
+      let marginalContribution = weights[i] * covTimesWeights[i];
       marginalContribution /= portfolioVolatility || 1;
 
       // 计算百分比风险贡献
@@ -2,5 +2,6 @@ export { SearchEngine } from './search_engine';
 export { RAGService } from './rag_service';
 export { QueryPlanner } from './query_planner';
 export { ContentProcessor } from './processors/content_processor';
+export { VectorStore } from './vector_store';
 export * from './tool_definitions';
 export * from './types';
\ No newline at end of file
@@ -6,6 +6,7 @@ import { SearchResultItem, SourceType } from '../types';
  * 负责清洗、去重、排序和聚合来自不同源的数据
  */
 export class ContentProcessor {
+  private static readonly MAX_RESULTS = 10;
   
   /**
    * 处理搜索结果
@@ -16,11 +17,8 @@ export class ContentProcessor {
     // 1. Deduplication (Simple ID based for now)
     const uniqueResults = this.deduplicate(rawResults);
 
-    // 2. Sorting by Reliability and Recency
-    const sortedResults = this.rank(uniqueResults);
-
-    // 3. Limit results (e.g., top 10)
-    return sortedResults.slice(0, 10);
+    // 2 & 3. Rank by Reliability and Recency, keeping only the top 10
+    return this.topK(uniqueResults, ContentProcessor.MAX_RESULTS);
   }
 
   private deduplicate(results: SearchResultItem[]): SearchResultItem[] {
@@ -33,15 +31,41 @@ export class ContentProcessor {
     });
   }
 
-  private rank(results: SearchResultItem[]): SearchResultItem[] {
-    return results.sort((a, b) => {
-      // Primary sort: Reliability
-      if (a.reliabilityScore !== b.reliabilityScore) {
-        return b.reliabilityScore - a.reliabilityScore; // Descending reliability
+  /**
+   * 选出排名前 k 的结果（稳定，与完整排序后截断的结果一致）
+   * 只维护长度为 k 的有序缓冲区，无需对全部结果排序
+   */
+  private topK(results: SearchResultItem[], k: number): SearchResultItem[] {
+    const top: SearchResultItem[] = [];
+    if (k <= 0) return top;
+
+    for (const item of results) {
+      if (top.length === k && ContentProcessor.compare(item, top[k - 1]) >= 0) continue;
+
+      // 二分查找插入位置（相等元素插在后面以保持稳定）
+      let low = 0;
+      let high = top.length;
+      while (low < high) {
+        const mid = (low + high) >>> 1;
+        if (ContentProcessor.compare(item, top[mid]) < 0) {
+          high = mid;
+        } else {
+          low = mid + 1;
+        }
       }
-      // Secondary sort: Publish Time
-      return b.publishTime - a.publishTime; // Newest first
-    });
+      top.splice(low, 0, item);
+      if (top.length > k) top.pop();
+    }
+    return top;
+  }
+
+  private static compare(a: SearchResultItem, b: SearchResultItem): number {
+    // Primary sort: Reliability
+    if (a.reliabilityScore !== b.reliabilityScore) {
+      return b.reliabilityScore - a.reliabilityScore; // Descending reliability
+    }
+    // Secondary sort: Publish Time
+    return b.publishTime - a.publishTime; // Newest first
   }
 
   /**
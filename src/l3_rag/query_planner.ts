@@ -1,5 +1,21 @@
 
 import { RAGQueryOptions, SourceType, UserIntent } from './types';
+import { KeywordAutomaton } from '../l6_infrastructure/keyword_automaton';
+
+/**
+ * 关键词 → 股票代码映射（关键词需为大写，匹配时查询会统一转为大写）
+ */
+export const TICKER_KEYWORDS: Record<string, string> = {
+  '0700': '0700.HK',
+  '腾讯': '0700.HK',
+  '阿里': 'BABA',
+  BABA: 'BABA',
+  '苹果': 'AAPL',
+  AAPL: 'AAPL',
+};
+
+// 模块加载时构建一次，单次扫描即可识别查询中的全部股票
+const tickerAutomaton = new KeywordAutomaton<string>(Object.entries(TICKER_KEYWORDS));
 
 /**
  * Query Planner
@@ -42,10 +58,8 @@ export class QueryPlanner {
       intent.requiredSources = [SourceType.OFFICIAL, SourceType.NEWS, SourceType.SOCIAL];
     }
 
-    // 简单实体提取 (Mock)
-    if (query.toUpperCase().includes('AAPL') || query.includes('苹果')) {
-      intent.detectedEntities.push('AAPL');
-    }
+    // 实体提取：关键词自动机，支持一次识别多只股票
+    intent.detectedEntities.push(...tickerAutomaton.matchAll(query.toUpperCase()));
 
     return intent;
   }
@@ -5,12 +5,17 @@ import { ContentProcessor } from './processors/content_processor';
 import { OfficialProvider } from './providers/official_provider';
 import { SocialProvider } from './providers/social_provider';
 import { WebProvider } from './providers/web_provider';
+import { safeGet, safeSet } from '../l6_infrastructure/cache';
 
 /**
  * RAG Service
  * L3 层的核心入口，协调规划、检索和处理流程
  */
 export class RAGService {
+  // 检索结果写入多进程共享缓存（key = rag:{query}）
+  private static readonly CACHE_KEY_PREFIX = 'rag:';
+  private static readonly CACHE_TTL_SECONDS = 300;
+
   private planner: QueryPlanner;
   private processor: ContentProcessor;
   private providers: Map<SourceType, IDataSource>;
@@ -32,6 +37,13 @@ export class RAGService {
    * @returns 处理后的搜索结果
    */
   async search(query: string): Promise<SearchResultItem[]> {
+    const cacheKey = `${RAGService.CACHE_KEY_PREFIX}${query}`;
+    const cached = await safeGet<SearchResultItem[]>(cacheKey);
+    if (cached) {
+      console.log(`[RAGService] Cache hit for query: "${query}"`);
+      return cached;
+    }
+
     console.log(`[RAGService] Processing query: "${query}"`);
 
     // 1. Plan
@@ -39,19 +51,20 @@ export class RAGService {
     console.log(`[RAGService] Intent: ${intent.primaryIntent}, Sources: ${intent.requiredSources.join(', ')}`);
 
     // 2. Retrieve (Parallel)
+    // 记录各数据源是否成功，缺失或失败的数据源会导致结果不完整
     const searchPromises = intent.requiredSources.map(async (sourceType) => {
       const provider = this.providers.get(sourceType);
-      if (!provider) return [];
+      if (!provider) return { items: [] as SearchResultItem[], complete: false };
       try {
-        return await provider.search(query);
+        return { items: await provider.search(query), complete: true };
       } catch (error) {
         console.error(`[RAGService] Error fetching from ${sourceType}:`, error);
-        return [];
+        return { items: [] as SearchResultItem[], complete: false };
       }
     });
 
-    const rawResultsArrays = await Promise.all(searchPromises);
-    const rawResults = rawResultsArrays.flat();
+    const sourceResults = await Promise.all(searchPromises);
+    const rawResults = sourceResults.flatMap((result) => result.items);
 
     // 3. Process
     let processedResults = this.processor.process(rawResults);
@@ -59,6 +72,11 @@ export class RAGService {
     // 4. Cross Check (Optional step in pipeline)
     processedResults = this.processor.crossCheck(processedResults);
 
+    // 不完整的结果（如 Official 失败导致社交内容被标记为未经证实）不写入缓存
+    if (sourceResults.every((result) => result.complete)) {
+      safeSet(cacheKey, processedResults, RAGService.CACHE_TTL_SECONDS);
+    }
+
     return processedResults;
   }
 }
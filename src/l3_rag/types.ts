@@ -40,3 +40,9 @@ export interface UserIntent {
   detectedEntities: string[]; // e.g., ["AAPL", "Tesla"]
   requiredSources: SourceType[];
 }
+
+export interface VectorSearchResult {
+  id: string;
+  content: string;
+  score: number; // 余弦相似度 [-1, 1]
+}
@@ -0,0 +1,138 @@
+import { VectorDocument } from '../types';
+import { VectorSearchResult } from './types';
+
+/**
+ * Vector Store
+ * 内存向量库：所有 embedding 归一化后按向量量化为 int8，存放在一块连续的 Int8Array 中（N × D），
+ * 每个向量附带一个缩放系数；检索时对整块矩阵做一次整数点积扫描，再选出 top-k
+ */
+export class VectorStore {
+  private embeddings: Int8Array;
+  private scales: Float32Array;
+  private ids: string[] = [];
+  private contents: string[] = [];
+  private capacity: number;
+
+  /**
+   * @param dimension 向量维度
+   * @param initialCapacity 初始容量（文档数），写满后按倍数扩容
+   */
+  constructor(private readonly dimension: number, initialCapacity: number = 64) {
+    this.capacity = Math.max(1, initialCapacity);
+    this.embeddings = new Int8Array(this.capacity * dimension);
+    this.scales = new Float32Array(this.capacity);
+  }
+
+  get size(): number {
+    return this.ids.length;
+  }
+
+  /**
+   * 添加文档（写入时完成归一化与 int8 量化，检索时无需再除以范数）
+   * @param doc 向量文档
+   */
+  addDocument(doc: VectorDocument): void {
+    this.assertDimension(doc.embedding.length);
+    if (this.ids.length === this.capacity) {
+      this.grow();
+    }
+
+    const index = this.ids.length;
+    this.scales[index] = this.quantize(
+      doc.embedding,
+      this.embeddings.subarray(index * this.dimension, (index + 1) * this.dimension)
+    );
+
+    this.ids.push(doc.id);
+    this.contents.push(doc.content);
+  }
+
+  /**
+   * 余弦相似度检索
+   * @param queryEmbedding 查询向量
+   * @param topK 返回数量
+   * @returns 按相似度降序排列的结果
+   */
+  searchSimilar(queryEmbedding: number[], topK: number = 5): VectorSearchResult[] {
+    this.assertDimension(queryEmbedding.length);
+
+    const n = this.ids.length;
+    const k = Math.min(topK, n);
+    if (k <= 0) return [];
+
+    const query = new Int8Array(this.dimension);
+    const queryScale = this.quantize(queryEmbedding, query);
+
+    // 有界插入选择 top-k，避免对全部 N 个分数排序
+    const topIndexes: number[] = [];
+    const topScores: number[] = [];
+    for (let i = 0; i < n; i++) {
+      const offset = i * this.dimension;
+      let dot = 0;
+      for (let d = 0; d < this.dimension; d++) {
+        dot += this.embeddings[offset + d] * query[d];
+      }
+      const score = dot * this.scales[i] * queryScale;
+
+      if (topScores.length === k && score <= topScores[k - 1]) continue;
+
+      let pos = topScores.length;
+      while (pos > 0 && topScores[pos - 1] < score) pos--;
+      topScores.splice(pos, 0, score);
+      topIndexes.splice(pos, 0, i);
+      if (topScores.length > k) {
+        topScores.pop();
+        topIndexes.pop();
+      }
+    }
+
+    return topIndexes.map((index, rank) => ({
+      id: this.ids[index],
+      content: this.contents[index],
+      score: topScores[rank],
+    }));
+  }
+
+  private grow(): void {
+    this.capacity *= 2;
+    const nextEmbeddings = new Int8Array(this.capacity * this.dimension);
+    nextEmbeddings.set(this.embeddings);
+    this.embeddings = nextEmbeddings;
+
+    const nextScales = new Float32Array(this.capacity);
+    nextScales.set(this.scales);
+    this.scales = nextScales;
+  }
+
+  /**
+   * 归一化并对称量化到 int8：q = round(v / scale)，scale = max|v| / 127
+   * @param vector 原始向量
+   * @param target 量化结果写入位置
+   * @returns 缩放系数（零向量返回 0）
+   */
+  private quantize(vector: number[], target: Int8Array): number {
+    let sumSquares = 0;
+    let maxAbs = 0;
+    for (let d = 0; d < this.dimension; d++) {
+      sumSquares += vector[d] * vector[d];
+      maxAbs = Math.max(maxAbs, Math.abs(vector[d]));
+    }
+    if (maxAbs === 0) {
+      target.fill(0);
+      return 0;
+    }
+
+    // 先按 max|v| 量化，再把单位化系数折算进 scale
+    const step = maxAbs / 127;
+    for (let d = 0; d < this.dimension; d++) {
+      target[d] = Math.round(vector[d] / step);
+    }
+    return step / Math.sqrt(sumSquares);
+  }
+
+  private assertDimension(length: number): void {
+    if (length !== this.dimension) {
+      throw new Error(`VectorStoreError: expected dimension ${this.dimension}, got ${length}`);
+    }
+  }
+}
@@ -1,6 +1,20 @@
-import axios, { AxiosResponse } from 'axios';
+import axios, { AxiosInstance, AxiosResponse } from 'axios';
+import http from 'http';
+import https from 'https';
 import { LLMGenerateOptions } from '../types';
 
+// SSE 帧解析常量
+const SSE_DATA_PREFIX = Buffer.from('data: ');
+const SSE_DONE_PAYLOAD = Buffer.from('[DONE]');
+const LF = 0x0a;
+const CR = 0x0d;
+const SPACE = 0x20;
+export const SSE_FRAME_INITIAL_BYTES = 16 * 1024;
+
+// 流式输出合并写入：累计 16 个片段或距首个未写片段超过 16ms 时写 stdout
+const STDOUT_FLUSH_PIECES = 16;
+const STDOUT_FLUSH_INTERVAL_MS = 16;
+
 /**
  * L4 Inference - LLM Service
  * 大语言模型服务，支持流式输出
@@ -9,6 +23,9 @@ export class LLMService {
   private provider: string;
   private apiKey?: string;
   private baseUrl: string;
+  private httpClient?: AxiosInstance;
+  private httpAgent?: http.Agent;
+  private httpsAgent?: https.Agent;
 
   constructor(
     provider: string = 'mock',
@@ -73,7 +90,6 @@ export class LLMService {
       return '[Error] API Key not found. Please set SILICONFLOW_API_KEY environment variable.';
     }
 
-    const url = `${this.baseUrl}/chat/completions`;
     const headers = {
       'Content-Type': 'application/json',
       Authorization: `Bearer ${this.apiKey}`,
@@ -96,42 +112,112 @@ export class LLMService {
 
       console.log(`\n[L4 Stream Start - ${this.provider}]\n`);
 
-      const response: AxiosResponse = await axios.post(url, payload, {
-        headers,
-        responseType: 'stream',
-      });
+      const response: AxiosResponse = await this.getHttpClient().post(
+        '/chat/completions',
+        payload,
+        { headers, responseType: 'stream' }
+      );
 
       return new Promise((resolve, reject) => {
-        response.data.on('data', (chunk: Buffer) => {
-          const lines = chunk.toString().split('\n');
-          for (const line of lines) {
-            const trimmedLine = line.trim();
-            if (trimmedLine.startsWith('data: ') && trimmedLine !== 'data: [DONE]') {
-              const jsonStr = trimmedLine.substring(6);
-              try {
-                const data = JSON.parse(jsonStr);
-
-                // Handle usage info
-                if (data.usage) {
-                  usageInfo = data.usage;
-                }
+        const pendingOutput: string[] = [];
+        let flushTimer: NodeJS.Timeout | undefined;
+        const flushOutput = (): void => {
+          if (flushTimer) {
+            clearTimeout(flushTimer);
+            flushTimer = undefined;
+          }
+          if (pendingOutput.length > 0) {
+            process.stdout.write(pendingOutput.join(''));
+            pendingOutput.length = 0;
+          }
+        };
+
+        // 直接在字节上切分 SSE 行并匹配前缀，只对 JSON 负载做 UTF-8 解码
+        const handleLine = (line: Buffer): void => {
+          let end = line.length;
+          while (end > 0 && (line[end - 1] === CR || line[end - 1] === SPACE)) {
+            end--;
+          }
+          if (
+            end <= SSE_DATA_PREFIX.length ||
+            line.compare(SSE_DATA_PREFIX, 0, SSE_DATA_PREFIX.length, 0, SSE_DATA_PREFIX.length) !== 0
+          ) {
+            return;
+          }
+
+          const payload = line.subarray(SSE_DATA_PREFIX.length, end);
+          if (payload.equals(SSE_DONE_PAYLOAD)) {
+            return;
+          }
 
-                // Handle content delta
-                if (data.choices && data.choices[0]) {
-                  const delta = data.choices[0].delta;
-                  if (delta && delta.content) {
-                    process.stdout.write(delta.content);
-                    fullContent += delta.content;
-                  }
+          try {
+            const data = JSON.parse(payload.toString('utf8'));
+
+            // Handle usage info
+            if (data.usage) {
+              usageInfo = data.usage;
+            }
+
+            // Handle content delta
+            if (data.choices && data.choices[0]) {
+              const delta = data.choices[0].delta;
+              if (delta && delta.content) {
+                pendingOutput.push(delta.content);
+                fullContent += delta.content;
+                if (pendingOutput.length >= STDOUT_FLUSH_PIECES) {
+                  flushOutput();
+                } else if (!flushTimer) {
+                  // 缓冲区由空变为非空时启动定时器，模型停顿时也能按时输出
+                  flushTimer = setTimeout(flushOutput, STDOUT_FLUSH_INTERVAL_MS);
+                  flushTimer.unref();
                 }
-              } catch (e) {
-                // Ignore JSON parse errors for incomplete chunks
               }
             }
+          } catch (e) {
+            // Ignore JSON parse errors for incomplete chunks
+          }
+        };
+
+        // 手动分帧：网络块追加到可复用的缓冲区，只处理以换行结尾的完整行，
+        // 跨块的半行留在缓冲区等待下一块
+        let frame = Buffer.allocUnsafe(SSE_FRAME_INITIAL_BYTES);
+        let frameLength = 0;
+
+        response.data.on('data', (chunk: Buffer) => {
+          if (frameLength + chunk.length > frame.length) {
+            let capacity = frame.length * 2;
+            while (capacity < frameLength + chunk.length) {
+              capacity *= 2;
+            }
+            const grown = Buffer.allocUnsafe(capacity);
+            frame.copy(grown, 0, 0, frameLength);
+            frame = grown;
+          }
+          chunk.copy(frame, frameLength);
+          frameLength += chunk.length;
+
+          const view = frame.subarray(0, frameLength);
+          let start = 0;
+          let newline = view.indexOf(LF, start);
+          while (newline !== -1) {
+            handleLine(view.subarray(start, newline));
+            start = newline + 1;
+            newline = view.indexOf(LF, start);
+          }
+
+          // 剩余半行移到缓冲区头部
+          if (start > 0) {
+            frame.copy(frame, 0, start, frameLength);
+            frameLength -= start;
           }
         });
 
         response.data.on('end', () => {
+          if (frameLength > 0) {
+            handleLine(frame.subarray(0, frameLength));
+            frameLength = 0;
+          }
+          flushOutput();
           const endTime = Date.now();
           const duration = (endTime - startTime) / 1000;
 
@@ -156,6 +242,7 @@ export class LLMService {
         });
 
         response.data.on('error', (error: Error) => {
+          flushOutput();
           reject(new Error(`[Error] Exception during API call: ${error.message}`));
         });
       });
@@ -167,6 +254,35 @@ export class LLMService {
     }
   }
 
+  /**
+   * 释放连接池（应用退出前调用）
+   */
+  close(): void {
+    this.httpAgent?.destroy();
+    this.httpsAgent?.destroy();
+    this.httpAgent = undefined;
+    this.httpsAgent = undefined;
+    this.httpClient = undefined;
+  }
+
+  /**
+   * 获取复用的 HTTP 客户端（懒加载）
+   * keep-alive 连接池使后续调用免去 TCP/TLS 握手
+   */
+  private getHttpClient(): AxiosInstance {
+    if (!this.httpClient) {
+      this.httpAgent = new http.Agent({ keepAlive: true, maxSockets: 32 });
+      this.httpsAgent = new https.Agent({ keepAlive: true, maxSockets: 32 });
+      this.httpClient = axios.create({
+        baseURL: this.baseUrl,
+        httpAgent: this.httpAgent,
+        httpsAgent: this.httpsAgent,
+        timeout: 120000,
+      });
+    }
+    return this.httpClient;
+  }
+
   /**
    * 延迟辅助函数
    */
@@ -1,3 +1,3 @@
 export { UserDB } from './user_db';
 export { NewsData } from './news_data';
-export { getStockPrice, getStockPrices } from './market_mcp';
+export { getStockPrice, getStockPrices, clearPriceCache } from './market_mcp';
@@ -1,56 +1,210 @@
 import yahooFinance from 'yahoo-finance2';
 import { StockPrice } from '../types';
+import { TTLCache, safeGet, safeSet } from '../l6_infrastructure/cache';
 
 /**
  * L5 Data - Market MCP (Model Context Protocol)
  * 市场数据源，获取实时行情数据
  */
 
+const parsedTtl = Number(process.env.PRICE_TTL_SECONDS ?? 60);
+
+/**
+ * 行情缓存有效期（秒），可通过环境变量 PRICE_TTL_SECONDS 调整，0 表示关闭缓存
+ */
+export const PRICE_TTL_SECONDS = Number.isFinite(parsedTtl) ? parsedTtl : 60;
+
+// 两级缓存：进程内 TTL 缓存 + 多进程共享缓存（Redis，key = px:{ticker}）
+const priceCache = new TTLCache<StockPrice>(PRICE_TTL_SECONDS);
+const SHARED_PRICE_KEY_PREFIX = 'px:';
+
+// 共享缓存中的行情附带拉取时间（跨进程比较，使用墙钟时间）
+interface SharedPrice {
+  price: StockPrice;
+  fetchedAt: number;
+}
+
+// 正在进行中的请求，同一 ticker 的并发调用共享一次上游请求
+const inflightPrices = new Map<string, Promise<StockPrice>>();
+
 /**
  * 获取指定股票代码的实时行情数据
+ * 有效期内的重复请求直接返回缓存结果
  * @param ticker 股票代码 (如 0700.HK, BABA, AAPL)
  * @returns 股票价格数据
  */
 export async function getStockPrice(ticker: string): Promise<StockPrice> {
-  try {
-    // 使用 yahoo-finance2 获取实时数据
-    const quote = await yahooFinance.quote(ticker);
+  const [price] = await getStockPrices([ticker]);
+  return price;
+}
+
+/**
+ * 批量获取多只股票的价格
+ * 本地缓存未命中的 ticker 先查共享缓存，仍未命中的合并为一次 yahoo-finance2 请求
+ * @param tickers 股票代码数组
+ * @returns 股票价格数据数组（与 tickers 顺序一致）
+ */
+export async function getStockPrices(tickers: string[]): Promise<StockPrice[]> {
+  // 缓存命中直接写入结果，只为未命中的 ticker 等待 Promise
+  const results: StockPrice[] = new Array(tickers.length);
+  const pendingIndexes: number[] = [];
+  const misses = new Set<string>();
+
+  for (let i = 0; i < tickers.length; i++) {
+    const cached = priceCache.get(tickers[i]);
+    if (cached) {
+      results[i] = cached;
+    } else {
+      pendingIndexes.push(i);
+      if (!inflightPrices.has(tickers[i])) {
+        misses.add(tickers[i]);
+      }
+    }
+  }
 
-    const lastPrice = quote.regularMarketPrice || 0;
-    const previousClose = quote.regularMarketPreviousClose || 0;
+  if (pendingIndexes.length === 0) {
+    return results;
+  }
 
-    let changePercent = 0;
-    if (lastPrice && previousClose) {
-      changePercent = ((lastPrice - previousClose) / previousClose) * 100;
+  if (misses.size > 0) {
+    const batch = loadStockPrices([...misses]);
+    for (const ticker of misses) {
+      const pending = batch
+        .then((prices) => prices.get(ticker) ?? createMockPrice(ticker))
+        .finally(() => inflightPrices.delete(ticker));
+      inflightPrices.set(ticker, pending);
     }
+  }
 
-    return {
-      ticker,
-      current_price: Math.round(lastPrice * 100) / 100,
-      change_percent: `${changePercent.toFixed(2)}%`,
-      volume: quote.regularMarketVolume || 0,
-    };
+  const pendingPrices = pendingIndexes.map(
+    (i) => inflightPrices.get(tickers[i]) as Promise<StockPrice>
+  );
+  const fetched = await Promise.all(pendingPrices);
+  pendingIndexes.forEach((index, k) => {
+    results[index] = fetched[k];
+  });
+
+  return results;
+}
+
+/**
+ * 清空本地行情缓存（共享缓存按 TTL 自然过期）
+ */
+export function clearPriceCache(): void {
+  priceCache.clear();
+  inflightPrices.clear();
+}
+
+/**
+ * 先从共享缓存读取，其余 ticker 再从上游拉取
+ */
+async function loadStockPrices(tickers: string[]): Promise<Map<string, StockPrice>> {
+  const shared = await Promise.all(tickers.map((ticker) => readSharedPrice(ticker)));
+  const now = Date.now();
+
+  const prices = new Map<string, StockPrice>();
+  const remaining: string[] = [];
+  tickers.forEach((ticker, i) => {
+    const entry = shared[i];
+    // 本地缓存只保留剩余有效期，保证行情自拉取起不超过 PRICE_TTL_SECONDS
+    const ttlLeft = entry ? PRICE_TTL_SECONDS - (now - entry.fetchedAt) / 1000 : 0;
+    if (entry && ttlLeft > 0) {
+      priceCache.set(ticker, entry.price, ttlLeft);
+      prices.set(ticker, entry.price);
+    } else {
+      remaining.push(ticker);
+    }
+  });
+
+  if (remaining.length > 0) {
+    const fetched = await fetchStockPrices(remaining);
+    for (const [ticker, price] of fetched) {
+      prices.set(ticker, price);
+    }
+  }
+
+  return prices;
+}
+
+function readSharedPrice(ticker: string): Promise<SharedPrice | null> {
+  if (PRICE_TTL_SECONDS <= 0) return Promise.resolve(null);
+  return safeGet<SharedPrice>(`${SHARED_PRICE_KEY_PREFIX}${ticker}`);
+}
+
+function writeSharedPrice(price: StockPrice): void {
+  if (PRICE_TTL_SECONDS <= 0) return;
+  const entry: SharedPrice = { price, fetchedAt: Date.now() };
+  safeSet(`${SHARED_PRICE_KEY_PREFIX}${price.ticker}`, entry, PRICE_TTL_SECONDS);
+}
+
+/**
+ * 从 yahoo-finance2 批量拉取行情，成功结果写入缓存
+ * 网络错误或未返回的 ticker 使用 mock 数据（不写入缓存）
+ */
+async function fetchStockPrices(tickers: string[]): Promise<Map<string, StockPrice>> {
+  const prices = new Map<string, StockPrice>();
+
+  try {
+    // 使用 yahoo-finance2 一次请求获取所有 ticker 的实时数据
+    const quotes = await yahooFinance.quote(tickers);
+
+    // Yahoo 会规范化代码（如 0700.hk -> 0700.HK），按大小写无关的方式映射回请求的 ticker
+    const requested = new Map<string, string[]>();
+    for (const ticker of tickers) {
+      const symbol = ticker.toUpperCase();
+      const aliases = requested.get(symbol);
+      if (aliases) {
+        aliases.push(ticker);
+      } else {
+        requested.set(symbol, [ticker]);
+      }
+    }
+
+    for (const quote of quotes) {
+      const lastPrice = quote.regularMarketPrice || 0;
+      const previousClose = quote.regularMarketPreviousClose || 0;
+
+      let changePercent = 0;
+      if (lastPrice && previousClose) {
+        changePercent = ((lastPrice - previousClose) / previousClose) * 100;
+      }
+
+      for (const ticker of requested.get(quote.symbol.toUpperCase()) ?? []) {
+        const price: StockPrice = {
+          ticker,
+          current_price: Math.round(lastPrice * 100) / 100,
+          change_percent: `${changePercent.toFixed(2)}%`,
+          volume: quote.regularMarketVolume || 0,
+        };
+        priceCache.set(ticker, price);
+        writeSharedPrice(price);
+        prices.set(ticker, price);
+      }
+    }
   } catch (error) {
-    // 网络错误时使用 mock 数据
     console.error(`yfinance error: ${error}, using mock data for demo.`);
-    const mockPrice = Math.random() * 400 + 100;
-    const mockChange = Math.random() * 10 - 5;
-    return {
-      ticker,
-      current_price: Math.round(mockPrice * 100) / 100,
-      change_percent: `${mockChange.toFixed(2)}%`,
-      volume: 1000000,
-      note: 'Mock Data (Network Error)',
-    };
   }
+
+  for (const ticker of tickers) {
+    if (!prices.has(ticker)) {
+      prices.set(ticker, createMockPrice(ticker));
+    }
+  }
+
+  return prices;
 }
 
 /**
- * 批量获取多只股票的价格
- * @param tickers 股票代码数组
- * @returns 股票价格数据数组
+ * 生成 mock 行情（用于演示）
  */
-export async function getStockPrices(tickers: string[]): Promise<StockPrice[]> {
-  const promises = tickers.map((ticker) => getStockPrice(ticker));
-  return Promise.all(promises);
+function createMockPrice(ticker: string): StockPrice {
+  const mockPrice = Math.random() * 400 + 100;
+  const mockChange = Math.random() * 10 - 5;
+  return {
+    ticker,
+    current_price: Math.round(mockPrice * 100) / 100,
+    change_percent: `${mockChange.toFixed(2)}%`,
+    volume: 1000000,
+    note: 'Mock Data (Network Error)',
+  };
 }
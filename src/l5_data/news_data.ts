@@ -1,29 +1,44 @@
 import { NewsSource } from '../types';
+import { TTLCache } from '../l6_infrastructure/cache';
+
+// 模拟新闻数据
+const MOCK_NEWS: Record<string, string[]> = {
+  '0700.HK': [
+    '腾讯发布最新季度财报，营收超预期',
+    '游戏业务回暖，腾讯股价看涨',
+  ],
+  BABA: [
+    '阿里拆分上市计划推进中',
+    '电商竞争加剧，阿里寻求新增长点',
+  ],
+  AAPL: ['iPhone 15销量火爆', '苹果Vision Pro即将发售'],
+};
+
+const SENTIMENT_CACHE_KEY = 'market';
 
 /**
  * L5 Data - News Data Source
  * 新闻数据源，提供公司新闻和市场情绪
  */
 export class NewsData implements NewsSource {
+  // 个股新闻缓存 5 分钟，市场情绪缓存 30 秒
+  private newsCache = new TTLCache<string[]>(300, 512);
+  private sentimentCache = new TTLCache<string>(30, 1);
+
   /**
    * 获取个股相关新闻/研报
    * @param ticker 股票代码
    * @returns 新闻列表
    */
   getCompanyNews(ticker: string): string[] {
-    // 模拟新闻数据
-    const mockNews: Record<string, string[]> = {
-      '0700.HK': [
-        '腾讯发布最新季度财报，营收超预期',
-        '游戏业务回暖，腾讯股价看涨',
-      ],
-      BABA: [
-        '阿里拆分上市计划推进中',
-        '电商竞争加剧，阿里寻求新增长点',
-      ],
-      AAPL: ['iPhone 15销量火爆', '苹果Vision Pro即将发售'],
-    };
-    return mockNews[ticker] || ['暂无相关重磅新闻'];
+    const cached = this.newsCache.get(ticker);
+    if (cached) {
+      return cached;
+    }
+
+    const news = MOCK_NEWS[ticker] || ['暂无相关重磅新闻'];
+    this.newsCache.set(ticker, news);
+    return news;
   }
 
   /**
@@ -31,7 +46,14 @@ export class NewsData implements NewsSource {
    * @returns 市场情绪字符串
    */
   getMarketSentiment(): string {
+    const cached = this.sentimentCache.get(SENTIMENT_CACHE_KEY);
+    if (cached) {
+      return cached;
+    }
+
     const sentiments = ['看多', '震荡', '看空'];
-    return sentiments[Math.floor(Math.random() * sentiments.length)];
+    const sentiment = sentiments[Math.floor(Math.random() * sentiments.length)];
+    this.sentimentCache.set(SENTIMENT_CACHE_KEY, sentiment);
+    return sentiment;
   }
 }
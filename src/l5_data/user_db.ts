@@ -10,16 +10,17 @@ export class UserDB {
 
   /**
    * 获取用户持仓
+   * 异步接口，接入真实数据库驱动时不会阻塞事件循环
    * @param userId 用户ID
    * @returns 持仓列表
    */
-  getUserHoldings(userId: string): Holding[] {
+  getUserHoldings(userId: string): Promise<Holding[]> {
     // 模拟返回一些持仓数据
-    return [
+    return Promise.resolve<Holding[]>([
       { ticker: '0700.HK', cost: 300.0, quantity: 100 },
       { ticker: 'BABA', cost: 80.0, quantity: 50 },
       { ticker: 'AAPL', cost: 150.0, quantity: 20 },
-    ];
+    ]);
   }
 
   /**
@@ -28,8 +29,8 @@ export class UserDB {
    * @param limit 返回记录数量限制
    * @returns 交易记录列表
    */
-  getRecentTransactions(userId: string, limit: number = 5): Transaction[] {
-    return [
+  getRecentTransactions(userId: string, limit: number = 5): Promise<Transaction[]> {
+    return Promise.resolve<Transaction[]>([
       {
         date: '2023-10-01',
         action: 'BUY',
@@ -44,6 +45,6 @@ export class UserDB {
         price: 80.0,
         quantity: 50,
       },
-    ];
+    ]);
   }
 }
@@ -1,3 +1,5 @@
+import { performance } from 'perf_hooks';
+
 /**
  * Infrastructure - Cache Service
  * 缓存服务接口与 Mock 实现
@@ -12,6 +14,8 @@ export interface ICacheService {
 
 export class RedisCacheService implements ICacheService {
   private static instance: RedisCacheService;
+  // Mock 存储的条目上限，避免长时间运行的进程中过期键（如 rag:{query}）无限累积
+  private static readonly MAX_ENTRIES = 10000;
   private storage: Map<string, { value: any; expiry: number }> = new Map();
 
   private constructor() {
@@ -38,8 +42,12 @@ export class RedisCacheService implements ICacheService {
   }
 
   async set<T>(key: string, value: T, ttlSeconds: number = 3600): Promise<void> {
-    const expiry = Date.now() + ttlSeconds * 1000;
-    this.storage.set(key, { value, expiry });
+    const now = Date.now();
+    this.storage.delete(key);
+    if (this.storage.size >= RedisCacheService.MAX_ENTRIES) {
+      this.evict(now);
+    }
+    this.storage.set(key, { value, expiry: now + ttlSeconds * 1000 });
   }
 
   async del(key: string): Promise<void> {
@@ -49,6 +57,105 @@ export class RedisCacheService implements ICacheService {
   async flush(): Promise<void> {
     this.storage.clear();
   }
+
+  /**
+   * 清除所有过期条目；释放不足 10% 时再按写入顺序淘汰最早的条目，
+   * 使整表扫描在多次写入间摊销
+   */
+  private evict(now: number): void {
+    for (const [key, item] of this.storage) {
+      if (now > item.expiry) this.storage.delete(key);
+    }
+
+    const target = Math.floor(RedisCacheService.MAX_ENTRIES * 0.9);
+    for (const key of this.storage.keys()) {
+      if (this.storage.size <= target) break;
+      this.storage.delete(key);
+    }
+  }
 }
 
 export const cache = RedisCacheService.getInstance();
+
+/**
+ * 容错读取：缓存服务异常时记录日志并视为未命中
+ */
+export async function safeGet<T>(key: string, service: ICacheService = cache): Promise<T | null> {
+  try {
+    return await service.get<T>(key);
+  } catch (error) {
+    console.error(`[Infra] Cache get failed for ${key}:`, error);
+    return null;
+  }
+}
+
+/**
+ * 容错写入：不等待结果，失败仅记录日志
+ */
+export function safeSet<T>(
+  key: string,
+  value: T,
+  ttlSeconds?: number,
+  service: ICacheService = cache
+): void {
+  service
+    .set(key, value, ttlSeconds)
+    .catch((error) => console.error(`[Infra] Cache set failed for ${key}:`, error));
+}
+
+/**
+ * 进程内 TTL 缓存（同步接口）
+ * 使用单调时钟判断过期，超出容量时淘汰最早写入的条目
+ */
+export class TTLCache<V> {
+  private storage: Map<string, { value: V; expiresAt: number }> = new Map();
+
+  /**
+   * @param ttlSeconds 过期时间（秒），<= 0 表示不缓存
+   * @param maxSize 最大条目数
+   */
+  constructor(
+    private readonly ttlSeconds: number,
+    private readonly maxSize: number = 1024
+  ) {}
+
+  get(key: string): V | undefined {
+    const item = this.storage.get(key);
+    if (!item) return undefined;
+
+    if (performance.now() >= item.expiresAt) {
+      this.storage.delete(key);
+      return undefined;
+    }
+
+    return item.value;
+  }
+
+  /**
+   * @param ttlSeconds 本条目的过期时间（秒），默认使用构造时的 ttlSeconds
+   */
+  set(key: string, value: V, ttlSeconds: number = this.ttlSeconds): void {
+    if (ttlSeconds <= 0) return;
+
+    // 重新插入以刷新写入顺序
+    this.storage.delete(key);
+    if (this.storage.size >= this.maxSize) {
+      const oldest = this.storage.keys().next().value;
+      if (oldest !== undefined) this.storage.delete(oldest);
+    }
+
+    this.storage.set(key, { value, expiresAt: performance.now() + ttlSeconds * 1000 });
+  }
+
+  delete(key: string): void {
+    this.storage.delete(key);
+  }
+
+  clear(): void {
+    this.storage.clear();
+  }
+
+  get size(): number {
+    return this.storage.size;
+  }
+}
@@ -0,0 +1,13 @@
+import * as nodeModule from 'module';
+
+/**
+ * V8 Compile Cache
+ * Node >= 22.1 可通过 module.enableCompileCache() 将模块编译结果持久化到磁盘，
+ * 后续启动直接复用，跳过解析与编译；旧版本 Node 下为空操作。
+ * 必须在加载其它业务模块之前导入。
+ */
+const { enableCompileCache } = nodeModule as unknown as {
+  enableCompileCache?: (cacheDir?: string) => unknown;
+};
+
+enableCompileCache?.(process.env.FIN_AGENT_COMPILE_CACHE_DIR);
@@ -0,0 +1,84 @@
+/**
+ * Infrastructure - Keyword Automaton
+ * Aho-Corasick 多模式匹配自动机，一次线性扫描找出文本中出现的所有关键字
+ */
+
+export class KeywordAutomaton<T> {
+  private transitions: Map<string, number>[] = [new Map()];
+  private failure: number[] = [0];
+  private outputs: T[][] = [[]];
+
+  /**
+   * @param entries 关键字与其对应值的列表，空关键字会被忽略
+   */
+  constructor(entries: Iterable<[string, T]>) {
+    for (const [keyword, value] of entries) {
+      this.addKeyword(keyword, value);
+    }
+    this.buildFailureLinks();
+  }
+
+  /**
+   * 扫描文本，返回所有命中关键字对应的值（允许关键字重叠）
+   * @param text 待扫描文本
+   * @returns 命中值集合
+   */
+  matchAll(text: string): Set<T> {
+    const hits = new Set<T>();
+    let state = 0;
+
+    for (const ch of text) {
+      let next = this.transitions[state].get(ch);
+      while (next === undefined && state !== 0) {
+        state = this.failure[state];
+        next = this.transitions[state].get(ch);
+      }
+      state = next ?? 0;
+
+      for (const value of this.outputs[state]) {
+        hits.add(value);
+      }
+    }
+
+    return hits;
+  }
+
+  private addKeyword(keyword: string, value: T): void {
+    if (!keyword) return;
+
+    let state = 0;
+    for (const ch of keyword) {
+      let next = this.transitions[state].get(ch);
+      if (next === undefined) {
+        next = this.transitions.length;
+        this.transitions.push(new Map());
+        this.failure.push(0);
+        this.outputs.push([]);
+        this.transitions[state].set(ch, next);
+      }
+      state = next;
+    }
+    this.outputs[state].push(value);
+  }
+
+  /**
+   * 按 BFS 顺序构建失败指针，并把后缀状态的输出合并到当前状态
+   */
+  private buildFailureLinks(): void {
+    const queue = Array.from(this.transitions[0].values());
+
+    for (let head = 0; head < queue.length; head++) {
+      const state = queue[head];
+      for (const [ch, next] of this.transitions[state]) {
+        queue.push(next);
+
+        let fallback = this.failure[state];
+        while (fallback !== 0 && !this.transitions[fallback].has(ch)) {
+          fallback = this.failure[fallback];
+        }
+        this.failure[next] = this.transitions[fallback].get(ch) ?? 0;
+        this.outputs[next].push(...this.outputs[this.failure[next]]);
+      }
+    }
+  }
+}
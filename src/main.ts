@@ -1,3 +1,4 @@
+import './l6_infrastructure/compile_cache';
 import { Dispatcher } from './l1_orchestration/dispatcher';
 import { LLMRouter } from './l4_inference/llm_router';
 
@@ -33,6 +34,8 @@ async function main(): Promise<void> {
   } catch (error) {
     console.error('Error processing request:', error);
     process.exit(1);
+  } finally {
+    llmService.close();
   }
 }
 
@@ -16,6 +16,15 @@ export interface Holding {
   quantity: number;
 }
 
+/**
+ * 持仓列式数据（SoA），由持仓列表构建一次后供各 L2 引擎共用
+ */
+export interface HoldingsBatch {
+  tickers: string[];
+  cost: Float64Array;
+  quantity: Float64Array;
+}
+
 /**
  * 市场行情数据
  */